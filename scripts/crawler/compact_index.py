@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Compact binary form of `content/index.json` for fast loading.
+
+`index.json` repeats every category, subcategory and path prefix in every
+entry, and parsing it builds a dict per entry. `index.bin` stores the same
+data column by column: strings are concatenated into one UTF-8 blob with an
+offset array, categories, subcategories and file path prefixes are interned
+into small tables, and entries are only decoded when accessed through a
+`__slots__` record view. Loading is a single read plus a few array copies.
+A per-row bitmask records which standard fields an entry actually has, so
+exporting gives back exactly the original entries.
+
+The crawler writes both files; `index.json` stays the compatibility format.
+
+Usage:
+    python compact_index.py build        # Build index.bin from index.json
+    python compact_index.py export       # Write index.json from index.bin
+    python compact_index.py stats        # Compare the two formats
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from array import array
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Optional
+
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent.parent
+CONTENT_DIR = PROJECT_ROOT / "content"
+INDEX_PATH = CONTENT_DIR / "index.json"
+COMPACT_INDEX_PATH = CONTENT_DIR / "index.bin"
+
+INDEX_MAGIC = b"PBPIDX01"
+INDEX_VERSION = 1
+HEADER_LENGTH_BYTES = 4
+
+# Free-text fields stored as offset + blob columns
+STRING_FIELDS = ["title", "url", "crawled_at"]
+# Low-cardinality fields stored as codes into an interned table
+INTERNED_FIELDS = ["category", "subcategory"]
+# Field order of a plain index.json entry
+ENTRY_FIELDS = ["title", "url", "category", "subcategory", "file", "crawled_at"]
+ALL_FIELDS_PRESENT = (1 << len(ENTRY_FIELDS)) - 1
+FIELD_BITS = {field: 1 << i for i, field in enumerate(ENTRY_FIELDS)}
+
+
+def _to_bytes(values: array) -> bytes:
+    # Stored little-endian regardless of platform
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(data, typecode: str = "I") -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _string_column(strings: list[str]) -> tuple[bytes, bytes]:
+    """Encode strings as (uint32 end offsets, concatenated UTF-8 blob)."""
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = array("I", [0])
+    total = 0
+    for data in encoded:
+        total += len(data)
+        offsets.append(total)
+    return _to_bytes(offsets), b"".join(encoded)
+
+
+def write_compact_index(index: dict, path: Path = COMPACT_INDEX_PATH):
+    """Write `index` (id -> entry dict) in the compact binary format."""
+    ids = list(index.keys())
+    entries = [index[k] for k in ids]
+
+    tables: dict = {name: [] for name in INTERNED_FIELDS + ["prefix"]}
+    lookup: dict = {name: {} for name in tables}
+
+    def intern(table: str, value: str) -> int:
+        code = lookup[table].get(value)
+        if code is None:
+            code = lookup[table][value] = len(tables[table])
+            tables[table].append(value)
+        return code
+
+    codes = {name: array("I") for name in tables}
+    present = array("I")
+    file_names = []
+    extras = []
+    for entry in entries:
+        # Bit i set when ENTRY_FIELDS[i] is in the entry; missing ones are
+        # stored as "" but must not come back on export
+        present.append(sum(bit for field, bit in FIELD_BITS.items() if field in entry))
+        for name in INTERNED_FIELDS:
+            codes[name].append(intern(name, entry.get(name, "")))
+
+        # "content/python/abc.md" -> prefix "content/python/" + "abc.md"
+        prefix, _, name = entry.get("file", "").rpartition("/")
+        codes["prefix"].append(intern("prefix", prefix + "/" if prefix else ""))
+        file_names.append(name)
+
+        # Fields beyond the standard ones survive the round trip as JSON
+        extra = {k: v for k, v in entry.items() if k not in ENTRY_FIELDS}
+        extras.append(json.dumps(extra, separators=(",", ":")) if extra else "")
+
+    sections = []
+    columns = {}
+
+    def add_section(name: str, data: bytes):
+        columns[name] = [sum(len(s) for s in sections), len(data)]
+        sections.append(data)
+
+    for name, strings in [("id", ids), ("file_name", file_names), ("extra", extras)] + [
+        (field, [e.get(field, "") for e in entries]) for field in STRING_FIELDS
+    ]:
+        offsets, blob = _string_column(strings)
+        add_section(f"{name}.offsets", offsets)
+        add_section(f"{name}.blob", blob)
+
+    for name, values in codes.items():
+        add_section(f"{name}.codes", _to_bytes(values))
+    add_section("present.codes", _to_bytes(present))
+
+    header = json.dumps({
+        "version": INDEX_VERSION,
+        "count": len(ids),
+        "tables": tables,
+        "columns": columns
+    }, separators=(",", ":")).encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(INDEX_MAGIC)
+        f.write(len(header).to_bytes(HEADER_LENGTH_BYTES, "little"))
+        f.write(header)
+        for data in sections:
+            f.write(data)
+    os.replace(tmp_path, path)
+
+
+class IndexRecord(Mapping):
+    """Read-only view of one index entry, decoded field by field on access."""
+
+    __slots__ = ("_index", "_row")
+
+    def __init__(self, index: "CompactIndex", row: int):
+        self._index = index
+        self._row = row
+
+    def __getitem__(self, key: str):
+        return self._index._field(self._row, key)
+
+    def __iter__(self):
+        return iter(self._index._keys(self._row))
+
+    def __len__(self) -> int:
+        return len(self._index._keys(self._row))
+
+    def __repr__(self) -> str:
+        return f"IndexRecord({dict(self)!r})"
+
+
+class CompactIndex(Mapping):
+    """Mapping of id -> IndexRecord backed by the compact binary columns."""
+
+    def __init__(self, data: bytes):
+        if data[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            raise ValueError("Not a compact index file")
+
+        start = len(INDEX_MAGIC)
+        header_length = int.from_bytes(data[start:start + HEADER_LENGTH_BYTES], "little")
+        start += HEADER_LENGTH_BYTES
+        header = json.loads(data[start:start + header_length])
+        if header.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported compact index version: {header.get('version')}")
+
+        self._data = data
+        self._base = start + header_length
+        self._columns = header["columns"]
+        self._count = header["count"]
+        self._tables = header["tables"]
+        self._offsets = {}
+        self._codes = {
+            name: _from_bytes(self._section(f"{name}.codes"))
+            for name in INTERNED_FIELDS + ["prefix"]
+        }
+        # Files written before the bitmask existed have every field
+        self._present = (
+            _from_bytes(self._section("present.codes"))
+            if "present.codes" in self._columns else None
+        )
+        self._rows: Optional[dict] = None  # id -> row, built on first lookup
+
+    def _section(self, name: str) -> memoryview:
+        offset, length = self._columns[name]
+        start = self._base + offset
+        return memoryview(self._data)[start:start + length]
+
+    def _string(self, column: str, row: int) -> str:
+        offsets = self._offsets.get(column)
+        if offsets is None:
+            offsets = self._offsets[column] = _from_bytes(self._section(f"{column}.offsets"))
+        offset, length = self._columns[f"{column}.blob"]
+        start = self._base + offset
+        return self._data[start + offsets[row]:start + offsets[row + 1]].decode("utf-8")
+
+    def _extra(self, row: int) -> dict:
+        extra = self._string("extra", row)
+        return json.loads(extra) if extra else {}
+
+    def _present_fields(self, row: int) -> list[str]:
+        mask = ALL_FIELDS_PRESENT if self._present is None else self._present[row]
+        return [field for field, bit in FIELD_BITS.items() if mask & bit]
+
+    def _field(self, row: int, key: str):
+        if self._present is not None and key in FIELD_BITS and not self._present[row] & FIELD_BITS[key]:
+            raise KeyError(key)
+        if key in INTERNED_FIELDS:
+            return self._tables[key][self._codes[key][row]]
+        if key in STRING_FIELDS:
+            return self._string(key, row)
+        if key == "file":
+            return self._tables["prefix"][self._codes["prefix"][row]] + self._string("file_name", row)
+        return self._extra(row)[key]
+
+    def _keys(self, row: int) -> list[str]:
+        return self._present_fields(row) + list(self._extra(row).keys())
+
+    def _id(self, row: int) -> str:
+        return self._string("id", row)
+
+    def __getitem__(self, link_id: str) -> IndexRecord:
+        if self._rows is None:
+            self._rows = {self._id(row): row for row in range(self._count)}
+        return IndexRecord(self, self._rows[link_id])
+
+    def __iter__(self):
+        for row in range(self._count):
+            yield self._id(row)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def items(self):
+        # Avoids the id -> row lookup that Mapping.items() would do per entry
+        for row in range(self._count):
+            yield self._id(row), IndexRecord(self, row)
+
+    def values(self):
+        for row in range(self._count):
+            yield IndexRecord(self, row)
+
+    def to_dict(self) -> dict:
+        """Export as plain dicts in index.json form."""
+        return {link_id: dict(record) for link_id, record in self.items()}
+
+
+def load_compact_index(
+    path: Path = COMPACT_INDEX_PATH,
+    json_path: Path = INDEX_PATH
+) -> Optional[CompactIndex]:
+    """Load index.bin, or return None if it is missing or older than index.json."""
+    if not path.exists():
+        return None
+    if json_path.exists() and json_path.stat().st_mtime > path.stat().st_mtime:
+        return None
+    try:
+        with open(path, "rb") as f:
+            return CompactIndex(f.read())
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not load compact index: {e}")
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build, export or inspect the compact binary index"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("build", help="Build index.bin from index.json")
+    export_parser = subparsers.add_parser("export", help="Write index.json from index.bin")
+    export_parser.add_argument(
+        "--output", "-o",
+        type=Path,
+        default=INDEX_PATH,
+        help="Output path (default: content/index.json)"
+    )
+    subparsers.add_parser("stats", help="Compare load time and size of both formats")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        if not INDEX_PATH.exists():
+            print("Error: Index not found. Run 'python crawl.py' first.")
+            exit(1)
+        with open(INDEX_PATH, "r") as f:
+            index = json.load(f)
+        write_compact_index(index)
+        print(f"✅ Wrote {len(index)} entries to {COMPACT_INDEX_PATH}")
+
+    elif args.command == "export":
+        if not COMPACT_INDEX_PATH.exists():
+            print("Error: Compact index not found. Run 'python compact_index.py build' first.")
+            exit(1)
+        with open(COMPACT_INDEX_PATH, "rb") as f:
+            index = CompactIndex(f.read())
+        with open(args.output, "w") as f:
+            json.dump(index.to_dict(), f, indent=2)
+        # Keep index.bin from looking stale next to the file it came from
+        os.utime(COMPACT_INDEX_PATH)
+        print(f"✅ Exported {len(index)} entries to {args.output}")
+
+    else:
+        for path in [INDEX_PATH, COMPACT_INDEX_PATH]:
+            if not path.exists():
+                print(f"{path.name}: missing")
+                continue
+            start = time.perf_counter()
+            with open(path, "rb") as f:
+                data = f.read()
+            index = CompactIndex(data) if path == COMPACT_INDEX_PATH else json.loads(data)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{path.name}: {len(index)} entries, {len(data):,} bytes, loaded in {elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,12 @@ Usage:
     python crawl.py --category python  # Crawl only Python-related links
     python crawl.py --limit 10         # Crawl only first 10 links
     python crawl.py --update           # Update existing content
+    python crawl.py --incremental      # Sync content with README link changes
+    python crawl.py --check-links      # Check README links without downloading
+    python crawl.py --follow-depth 2   # Also crawl same-site pages linked from each resource
+    python crawl.py --shard 0/4        # Crawl only shard 0 of 4
+    python crawl.py --merge            # Merge shard fragments into the index
+    python crawl.py --profile          # Write a CPU/memory profile report
 """
 
 import os
@@ -19,6 +25,7 @@ import ssl
 import hashlib
 import argparse
 import asyncio
+import time
 import certifi
 from datetime import datetime
 from pathlib import Path
@@ -27,9 +34,6 @@ from typing import Optional
 
 try:
     import aiohttp
-    import aiofiles
-    from bs4 import BeautifulSoup
-    from markdownify import markdownify as md
     from tqdm import tqdm
     import yaml
 except ImportError as e:
@@ -37,6 +41,14 @@ except ImportError as e:
     print("Please run: pip install -r requirements.txt")
     exit(1)
 
+from compact_index import write_compact_index
+from extract import DEFAULT_ENGINE, ENGINES, extract_html
+from frontier import DEFAULT_MAX_PAGES_PER_SEED, Frontier, link_base
+from pack import open_pack, read_document
+from profiling import NO_PHASE, add_profile_argument, maybe_profile
+from search_cache import clear_search_cache
+from writer import DocumentWriter
+
 
 # Configuration
 SCRIPT_DIR = Path(__file__).parent
@@ -45,12 +57,29 @@ README_PATH = PROJECT_ROOT / "README.md"
 CONTENT_DIR = PROJECT_ROOT / "content"
 INDEX_PATH = CONTENT_DIR / "index.json"
 METADATA_PATH = CONTENT_DIR / "metadata.yaml"
+SHARDS_DIR = CONTENT_DIR / "shards"
+LINK_MANIFEST_PATH = CONTENT_DIR / "links.json"
+LINK_HEALTH_PATH = CONTENT_DIR / "link_health.json"
 
 # Rate limiting
 MAX_CONCURRENT_REQUESTS = 5
 REQUEST_DELAY = 1  # seconds between requests
 REQUEST_TIMEOUT = 30  # seconds
 
+# Connection pooling
+CONNECTION_LIMIT = 100  # open connections across all hosts
+CONNECTION_LIMIT_PER_HOST = 4  # keeps any single host (e.g. GitHub) polite
+DNS_CACHE_TTL = 300  # seconds to cache resolved hostnames
+KEEPALIVE_TIMEOUT = 30  # seconds an idle connection stays in the pool
+
+# Link health checks (--check-links)
+CHECK_CONCURRENCY = 50  # no bodies are downloaded, so go much wider
+CHECK_TIMEOUT = 15  # seconds per link, including redirects
+
+# Incremental crawls refuse to prune more than this share of known links
+# (e.g. a truncated README mid-checkout) without --allow-mass-removal
+MAX_REMOVED_FRACTION = 0.5
+
 # User agent
 USER_AGENT = "ProgrammingBestPractices-Crawler/1.0 (Knowledge Base Builder)"
 
@@ -58,8 +87,25 @@ USER_AGENT = "ProgrammingBestPractices-Crawler/1.0 (Knowledge Base Builder)"
 class ContentCrawler:
     """Crawls and stores content from external links."""
 
-    def __init__(self, max_concurrent: int = MAX_CONCURRENT_REQUESTS):
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+        connection_limit: int = CONNECTION_LIMIT,
+        connection_limit_per_host: int = CONNECTION_LIMIT_PER_HOST,
+        dns_cache_ttl: int = DNS_CACHE_TTL,
+        keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+        html_engine: str = DEFAULT_ENGINE,
+        host_sync: bool = False,
+        profiler=None
+    ):
         self.max_concurrent = max_concurrent
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.html_engine = html_engine
+        self.host_sync = host_sync
+        self.profiler = profiler  # Set by --profile for wall-clock phases
         self.semaphore = asyncio.Semaphore(max_concurrent)
         self.session: Optional[aiohttp.ClientSession] = None
         self.index: dict = {}
@@ -67,9 +113,20 @@ class ContentCrawler:
             "total": 0,
             "success": 0,
             "failed": 0,
-            "skipped": 0
+            "skipped": 0,
+            # Connection statistics, filled in by the session trace hooks
+            "requests": 0,
+            "connections_new": 0,
+            "connections_reused": 0,
+            "tls_handshakes": 0,
+            "dns_lookups": 0,
+            "dns_cache_hits": 0
         }
         self.failed_urls = []  # Track failed URLs with details
+        self.packed: set = set()  # Document paths already stored in a content pack
+        self.removed_ids: list[str] = []  # Index entries pruned by --incremental
+        self.writer: Optional[DocumentWriter] = None  # Set for the duration of crawl_all
+        self.frontier: Optional[Frontier] = None  # Set when following links
 
     async def __aenter__(self):
         timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
@@ -84,11 +141,19 @@ class ContentCrawler:
             ssl_context.verify_mode = ssl.CERT_NONE
             print("⚠️  Warning: SSL verification disabled")
         
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
+        connector = aiohttp.TCPConnector(
+            ssl=ssl_context,
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl,
+            keepalive_timeout=self.keepalive_timeout
+        )
         self.session = aiohttp.ClientSession(
             timeout=timeout,
             connector=connector,
-            headers={"User-Agent": USER_AGENT}
+            headers={"User-Agent": USER_AGENT},
+            trace_configs=[self._connection_trace()]
         )
         return self
 
@@ -96,6 +161,45 @@ class ContentCrawler:
         if self.session:
             await self.session.close()
 
+    def _phase(self, name: str):
+        """Time a block when profiling; a shared no-op context otherwise."""
+        return self.profiler.phase(name) if self.profiler else NO_PHASE
+
+    def _connection_trace(self) -> aiohttp.TraceConfig:
+        """Count connection reuse, TLS handshakes and DNS lookups."""
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            self.stats["requests"] += 1
+            ctx.scheme = params.url.scheme
+
+        async def on_request_redirect(session, ctx, params):
+            # A redirect may hop to another scheme before reconnecting
+            location = params.response.headers.get('Location', '')
+            ctx.scheme = urlparse(urljoin(str(params.url), location)).scheme
+
+        async def on_connection_create_end(session, ctx, params):
+            self.stats["connections_new"] += 1
+            if getattr(ctx, "scheme", "") == "https":
+                self.stats["tls_handshakes"] += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self.stats["connections_reused"] += 1
+
+        async def on_dns_resolvehost_end(session, ctx, params):
+            self.stats["dns_lookups"] += 1
+
+        async def on_dns_cache_hit(session, ctx, params):
+            self.stats["dns_cache_hits"] += 1
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_redirect.append(on_request_redirect)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+        trace.on_dns_cache_hit.append(on_dns_cache_hit)
+        return trace
+
     def extract_links_from_readme(self) -> list[dict]:
         """Extract all external links from README.md with context."""
         if not README_PATH.exists():
@@ -208,7 +312,8 @@ class ContentCrawler:
                     
                     if 'text/html' in content_type:
                         html = await response.text()
-                        return self._process_html(html, url)
+                        with self._phase("process_html"):
+                            return self._process_html(html, url)
                     elif 'text/markdown' in content_type or url.endswith('.md'):
                         markdown = await response.text()
                         return {
@@ -237,7 +342,8 @@ class ContentCrawler:
                         "error": error_msg,
                         "timestamp": datetime.now().isoformat()
                     })
-                await asyncio.sleep(REQUEST_DELAY)
+                with self._phase("rate_limit_delay"):
+                    await asyncio.sleep(REQUEST_DELAY)
 
     async def _fetch_github_readme(self, url: str) -> Optional[dict]:
         """Fetch README from a GitHub repository."""
@@ -286,59 +392,157 @@ class ContentCrawler:
 
     def _process_html(self, html: str, url: str) -> dict:
         """Process HTML content and convert to markdown."""
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Remove unwanted elements
-        for tag in soup.find_all(['script', 'style', 'nav', 'footer', 'header', 'aside']):
-            tag.decompose()
-        
-        # Try to find main content
-        main_content = None
-        for selector in ['article', 'main', '.content', '.post-content', '.markdown-body', '#content']:
-            main_content = soup.select_one(selector)
-            if main_content:
-                break
-        
-        if not main_content:
-            main_content = soup.body if soup.body else soup
-        
-        # Convert to markdown
-        markdown_content = md(str(main_content), heading_style="ATX")
-        
-        # Get title
-        title = ""
-        if soup.title:
-            title = soup.title.string or ""
-        elif soup.h1:
-            title = soup.h1.get_text()
-        
-        # Get description
-        description = ""
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc:
-            description = meta_desc.get('content', '')
-        
+        extracted = extract_html(html, self.html_engine)
         return {
             "type": "html",
-            "content": markdown_content,
-            "title": title,
-            "description": description,
+            "content": extracted["content"],
+            "title": extracted["title"],
+            "description": extracted["description"],
             "url": url
         }
 
+    def _content_path(self, link: dict) -> Path:
+        """Directory a link's document lives in, derived from its category."""
+        return CONTENT_DIR / link["category"].lower().replace(' ', '_')
+
+    def load_link_manifest(self) -> dict:
+        """Load the README link set recorded by the previous incremental run."""
+        if not LINK_MANIFEST_PATH.exists():
+            return {}
+        with open(LINK_MANIFEST_PATH, 'r') as f:
+            return json.load(f)
+
+    def diff_links(self, previous: list[dict], links: list[dict]) -> dict:
+        """Compare README links with the previous run's link set."""
+        if not previous:
+            # No manifest yet: what has been crawled is the best baseline
+            # (pages found by --follow-depth belong to their seed, not the README)
+            previous = [{"id": k, **v} for k, v in self.index.items() if "seed" not in v]
+        # A URL listed under several sections is one document, filed under
+        # its first section; comparing every copy would report it as moved
+        previous = unique_links(previous)
+        links = unique_links(links)
+        before = {l["id"]: l for l in previous}
+        current = {l["id"]: l for l in links}
+
+        changes = {"added": [], "removed": [], "moved": [], "retitled": [], "missing": []}
+        for link in links:
+            old = before.get(link["id"])
+            if old is None:
+                changes["added"].append(link)
+                continue
+            if (old["category"], old["subcategory"]) != (link["category"], link["subcategory"]):
+                changes["moved"].append(link)
+            elif old["title"] != link["title"]:
+                changes["retitled"].append(link)
+            if link["id"] not in self.index:
+                # Unchanged in the README but never crawled successfully
+                changes["missing"].append(link)
+
+        changes["removed"] = [l for l in previous if l["id"] not in current]
+        return changes
+
+    def apply_link_changes(self, changes: dict):
+        """Relocate, retag and prune documents without any network calls."""
+        for link in changes["moved"] + changes["retitled"]:
+            entry = self.index.get(link["id"])
+            if entry is None:
+                continue
+            entry["file"] = self._relocate_document(link, entry)
+            entry["title"] = link["title"]
+            entry["category"] = link["category"]
+            entry["subcategory"] = link["subcategory"]
+
+        # Pages followed from a moved seed move with it
+        for link in changes["moved"]:
+            for child_id in self._followed_pages(link["id"]):
+                entry = self.index[child_id]
+                child = {**link, "id": child_id, "title": entry["title"]}
+                entry["file"] = self._relocate_document(child, entry)
+                entry["category"] = link["category"]
+                entry["subcategory"] = link["subcategory"]
+
+        for link in changes["removed"]:
+            for link_id in [link["id"]] + self._followed_pages(link["id"]):
+                entry = self.index.pop(link_id, None)
+                if entry is None:
+                    continue
+                self.removed_ids.append(link_id)
+                file_path = PROJECT_ROOT / entry["file"]
+                if file_path.exists():
+                    file_path.unlink()
+                    if not any(file_path.parent.iterdir()):
+                        file_path.parent.rmdir()
+
+    def _followed_pages(self, seed_id: str) -> list[str]:
+        """Ids of index entries crawled by following links from `seed_id`."""
+        return [k for k, v in self.index.items() if v.get("seed") == seed_id]
+
+    def _discover(self, link: dict, content: Optional[str] = None, file_path: Optional[Path] = None):
+        """Queue links found in a crawled page; a bad link never fails the page itself."""
+        try:
+            if content is None:
+                content = read_document(str(file_path.relative_to(PROJECT_ROOT)))
+            self.frontier.discover(link, content or "")
+        except Exception as e:
+            print(f"⚠️  Warning: Could not follow links from {link['url']}: {e}")
+
+    def _relocate_document(self, link: dict, entry: dict) -> str:
+        """Move a document to its link's category and update its frontmatter."""
+        old_path = PROJECT_ROOT / entry["file"]
+        if not old_path.exists():
+            # Packed documents keep their pack key; only the index changes
+            return entry["file"]
+
+        new_path = self._content_path(link) / f"{link['id']}.md"
+        with open(old_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        if content.startswith('---\n'):
+            end = content.find('\n---\n', 3)
+            if end > 0:
+                frontmatter = yaml.safe_load(content[4:end + 1]) or {}
+                frontmatter.update({
+                    "title": link["title"],
+                    "category": link["category"],
+                    "subcategory": link["subcategory"]
+                })
+                body = content[end + 5:].replace(
+                    f"# {entry['title']}\n", f"# {link['title']}\n", 1
+                )
+                content = f"---\n{yaml.dump(frontmatter, default_flow_style=False)}---\n{body}"
+
+        new_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = new_path.with_suffix(".md.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, new_path)
+
+        if old_path != new_path:
+            old_path.unlink()
+            if not any(old_path.parent.iterdir()):
+                old_path.parent.rmdir()
+
+        return str(new_path.relative_to(PROJECT_ROOT))
+
     async def crawl_link(self, link: dict, update: bool = False) -> bool:
         """Crawl a single link and save content."""
         link_id = link["id"]
-        content_path = CONTENT_DIR / link["category"].lower().replace(' ', '_')
+        content_path = self._content_path(link)
         file_path = content_path / f"{link_id}.md"
 
-        # Skip if already exists and not updating
-        if file_path.exists() and not update:
+        # Skip if already exists (loose or packed) and not updating
+        packed = file_path.relative_to(PROJECT_ROOT).as_posix() in self.packed
+        if (file_path.exists() or packed) and not update:
             self.stats["skipped"] += 1
+            if self.frontier is not None and file_path.exists():
+                # Keep descending through pages crawled on earlier runs
+                self._discover(link, file_path=file_path)
             return True
 
         # Fetch content
-        result = await self.fetch_content(link["url"])
+        with self._phase("fetch"):
+            result = await self.fetch_content(link["url"])
         
         if not result:
             self.stats["failed"] += 1
@@ -361,8 +565,9 @@ class ContentCrawler:
                         f["subcategory"] = link["subcategory"]
             return False
 
-        # Create directory
-        content_path.mkdir(parents=True, exist_ok=True)
+        # Followed pages are better named by their own title than by link text
+        if "seed" in link and result.get("title", "").strip():
+            link = {**link, "title": result["title"].strip()}
 
         # Create markdown file with frontmatter
         frontmatter = {
@@ -386,8 +591,20 @@ class ContentCrawler:
 {result["content"]}
 """
 
-        async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-            await f.write(content)
+        try:
+            with self._phase("write_file"):
+                await self.writer.write(file_path, content)
+        except OSError as e:
+            self.stats["failed"] += 1
+            self.failed_urls.append({
+                "url": link["url"],
+                "title": link["title"],
+                "category": link["category"],
+                "subcategory": link["subcategory"],
+                "error": f"Write error: {str(e)}",
+                "timestamp": datetime.now().isoformat()
+            })
+            return False
 
         # Update index
         self.index[link_id] = {
@@ -398,19 +615,101 @@ class ContentCrawler:
             "file": str(file_path.relative_to(PROJECT_ROOT)),
             "crawled_at": datetime.now().isoformat()
         }
+        if "seed" in link:
+            self.index[link_id]["seed"] = link["seed"]
+            self.index[link_id]["depth"] = link["depth"]
+
+        if self.frontier is not None:
+            self._discover(link, result["content"])
 
         self.stats["success"] += 1
         return True
 
+    async def crawl_frontier(self, update: bool = False):
+        """Crawl pages queued in the frontier until it or the budgets run out."""
+        print("\n🔗 Following links from crawled pages...")
+        progress = tqdm(total=len(self.frontier))
+        while len(self.frontier):
+            batch = self.frontier.pop_batch(self.max_concurrent * 4)
+            for link in batch:
+                link["id"] = self._generate_id(link["url"])
+            self.stats["total"] += len(batch)
+
+            await asyncio.gather(*(self.crawl_link(link, update) for link in batch))
+
+            # Crawled pages feed new links back, so the total keeps growing
+            progress.total = progress.n + len(batch) + len(self.frontier)
+            progress.update(len(batch))
+        progress.close()
+
+        for key, value in self.frontier.stats.items():
+            self.stats[f"frontier_{key}"] = value
+
     async def crawl_all(
         self, 
         category: Optional[str] = None,
         limit: Optional[int] = None,
-        update: bool = False
-    ):
-        """Crawl all links from README.md."""
+        update: bool = False,
+        shard: Optional[tuple[int, int]] = None,
+        incremental: bool = False,
+        follow_depth: int = 0,
+        max_pages_per_seed: int = DEFAULT_MAX_PAGES_PER_SEED,
+        allow_mass_removal: bool = False
+    ) -> bool:
+        """Crawl all links from README.md; returns False if nothing was attempted."""
+        # Load existing index
+        if INDEX_PATH.exists():
+            with open(INDEX_PATH, 'r') as f:
+                self.index = json.load(f)
+
         print("📚 Extracting links from README.md...")
-        links = self.extract_links_from_readme()
+        manifest = self.load_link_manifest() if incremental else {}
+        readme_hash = ""
+        if incremental and README_PATH.exists():
+            readme_hash = hashlib.sha256(README_PATH.read_bytes()).hexdigest()
+
+        with self._phase("extract_links"):
+            if readme_hash and manifest.get("readme_sha256") == readme_hash:
+                # README unchanged: reuse the recorded links instead of re-parsing
+                links = manifest["links"]
+            else:
+                links = self.extract_links_from_readme()
+
+        all_links = links
+        if incremental:
+            if not links:
+                # A missing or empty README would otherwise prune everything
+                print("ERROR: README.md is missing or has no links; "
+                      "incremental sync aborted, content/ left untouched")
+                return False
+
+            # The manifest keeps the same one-link-per-id view that is diffed
+            all_links = unique_links(links)
+            changes = self.diff_links(manifest.get("links", []), links)
+
+            removed = len(changes["removed"])
+            known = removed + len(all_links) - len(changes["added"])
+            if removed > 1 and removed > known * MAX_REMOVED_FRACTION and not allow_mass_removal:
+                print(f"ERROR: {removed} of {known} known links would be removed; "
+                      "incremental sync aborted, content/ left untouched")
+                print("   Check README.md, or rerun with --allow-mass-removal to prune them")
+                return False
+
+            if shard:
+                # Each shard relocates and prunes only the ids it owns
+                shard_index, shard_count = shard
+                changes = {
+                    kind: [l for l in group if shard_of(l["id"], shard_count) == shard_index]
+                    for kind, group in changes.items()
+                }
+            self.apply_link_changes(changes)
+            for kind in ["added", "removed", "moved", "retitled"]:
+                self.stats[f"links_{kind}"] = len(changes[kind])
+            print(f"   README changes: {len(changes['added'])} added, "
+                  f"{len(changes['removed'])} removed, {len(changes['moved'])} moved, "
+                  f"{len(changes['retitled'])} retitled")
+            # Only new links (and earlier failures) need fetching
+            links = changes["added"] + changes["missing"]
         
         if category:
             links = [l for l in links if category.lower() in l["category"].lower()]
@@ -420,13 +719,26 @@ class ContentCrawler:
             links = links[:limit]
             print(f"   Limited to {limit} links")
 
+        if shard:
+            shard_index, shard_count = shard
+            links = [l for l in links if shard_of(l["id"], shard_count) == shard_index]
+            print(f"   Shard {shard_index}/{shard_count}")
+
         self.stats["total"] = len(links)
         print(f"   Found {len(links)} links to crawl\n")
 
-        # Load existing index
-        if INDEX_PATH.exists():
-            with open(INDEX_PATH, 'r') as f:
-                self.index = json.load(f)
+        pack = open_pack()
+        if pack:
+            with pack:
+                self.packed = set(pack.keys())
+
+        if follow_depth > 0:
+            self.frontier = Frontier(follow_depth, max_pages_per_seed)
+            # README links are crawled as seeds, never again as followed pages
+            for link in all_links:
+                self.frontier.mark_visited(link["url"])
+                # GitHub seeds are stored from the form their links resolve against
+                self.frontier.mark_visited(link_base(link["url"]))
 
         # Crawl with progress bar
         print("🕷️  Crawling content...")
@@ -434,63 +746,404 @@ class ContentCrawler:
         for link in links:
             tasks.append(self.crawl_link(link, update))
         
-        # Process with progress bar
-        for i, task in enumerate(tqdm(asyncio.as_completed(tasks), total=len(tasks))):
-            await task
+        # Process with progress bar; documents go through the write-behind stage
+        async with DocumentWriter(host_sync=self.host_sync) as self.writer:
+            with self._phase("crawl_total"):
+                for i, task in enumerate(tqdm(asyncio.as_completed(tasks), total=len(tasks))):
+                    await task
+
+                if self.frontier is not None:
+                    await self.crawl_frontier(update)
+
+        for key, value in self.writer.stats.items():
+            self.stats[f"write_{key}"] = value
 
-        # Save index
         CONTENT_DIR.mkdir(parents=True, exist_ok=True)
+
+        # A shard only applies its own share of the README changes, so the
+        # manifest is written by `--merge` once every shard has run
+        manifest = {"readme_sha256": readme_hash, "links": all_links} if incremental else None
+
+        if shard:
+            # Shards never touch the shared outputs; `--merge` combines them
+            fragment_path = write_shard_fragment(
+                shard, self.index, self.stats, self.failed_urls, self.removed_ids, manifest
+            )
+            print(f"\n🧩 Shard fragment saved to: {fragment_path}")
+            # The failure report is only written by `--merge`
+            print_summary(self.stats, [])
+            print("   Run 'python crawl.py --merge' once all shards finish")
+            return True
+
+        # Save index
         with open(INDEX_PATH, 'w') as f:
             json.dump(self.index, f, indent=2)
+        write_compact_index(self.index)
+        clear_search_cache()
 
-        # Save metadata
-        metadata = {
-            "last_crawl": datetime.now().isoformat(),
-            "total_resources": len(self.index),
-            "categories": list(set(v["category"] for v in self.index.values())),
-            "stats": self.stats
-        }
-        with open(METADATA_PATH, 'w') as f:
-            yaml.dump(metadata, f)
+        if manifest:
+            write_link_manifest(manifest["readme_sha256"], manifest["links"])
+
+        write_metadata(self.index, self.stats)
 
         # Generate failure report if there are failed URLs
         if self.failed_urls:
-            report_path = CONTENT_DIR / "failed_urls_report.md"
-            with open(report_path, 'w') as f:
-                f.write("# Failed URLs Report\n\n")
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                f.write(f"Total Failed: {len(self.failed_urls)}\n\n")
-                f.write("---\n\n")
-                
-                # Group by category
-                by_category = {}
-                for failed in self.failed_urls:
-                    category = failed.get('category', 'Unknown')
-                    if category not in by_category:
-                        by_category[category] = []
-                    by_category[category].append(failed)
-                
-                for category, failures in sorted(by_category.items()):
-                    f.write(f"## {category}\n\n")
-                    for failed in failures:
-                        f.write(f"### {failed.get('title', 'Unknown Title')}\n\n")
-                        f.write(f"- **URL**: {failed['url']}\n")
-                        f.write(f"- **Error**: {failed.get('error', 'Unknown error')}\n")
-                        if failed.get('subcategory'):
-                            f.write(f"- **Subcategory**: {failed['subcategory']}\n")
-                        f.write(f"- **Timestamp**: {failed.get('timestamp', 'N/A')}\n")
-                        f.write("\n")
-            
+            report_path = write_failure_report(self.failed_urls)
             print(f"\n⚠️  Failed URLs report saved to: {report_path}")
 
-        # Print summary
-        print("\n📊 Crawl Summary:")
-        print(f"   ✅ Success: {self.stats['success']}")
-        print(f"   ⏭️  Skipped: {self.stats['skipped']}")
-        print(f"   ❌ Failed:  {self.stats['failed']}")
-        if self.failed_urls:
-            print(f"\n📋 Failed URLs Report: {CONTENT_DIR / 'failed_urls_report.md'}")
+        print_summary(self.stats, self.failed_urls)
         print(f"\n📁 Content saved to: {CONTENT_DIR}")
+        return True
+
+    async def check_link(self, link: dict) -> dict:
+        """Check one link with HEAD, falling back to a ranged GET."""
+        result = {
+            "title": link["title"],
+            "url": link["url"],
+            "subcategory": link["subcategory"],
+            "ok": False,
+            "status": None,
+            "method": "HEAD",
+            "final_url": link["url"],
+            "redirects": [],
+            "latency_ms": None,
+            "error": None
+        }
+        timeout = aiohttp.ClientTimeout(total=CHECK_TIMEOUT)
+
+        async with self.semaphore:
+            start = time.perf_counter()
+            try:
+                async with self.session.head(
+                    link["url"], allow_redirects=True, timeout=timeout
+                ) as response:
+                    self._record_check(result, response)
+            except asyncio.TimeoutError:
+                result["error"] = "Request timeout"
+            except aiohttp.ClientError as e:
+                result["error"] = f"Network error: {str(e)}"
+
+            # Many servers reject or mishandle HEAD; confirm with one byte of GET
+            if not result["ok"] and result["error"] != "Request timeout":
+                result["method"] = "GET"
+                result["error"] = None
+                try:
+                    async with self.session.get(
+                        link["url"],
+                        allow_redirects=True,
+                        timeout=timeout,
+                        headers={"Range": "bytes=0-0"}
+                    ) as response:
+                        self._record_check(result, response)
+                except asyncio.TimeoutError:
+                    result["error"] = "Request timeout"
+                except aiohttp.ClientError as e:
+                    result["error"] = f"Network error: {str(e)}"
+
+            result["latency_ms"] = round((time.perf_counter() - start) * 1000, 1)
+
+        if not result["ok"] and not result["error"]:
+            result["error"] = f"HTTP {result['status']}"
+        return result
+
+    def _record_check(self, result: dict, response: aiohttp.ClientResponse):
+        """Copy status and redirect chain from a response, without reading it."""
+        result["status"] = response.status
+        result["ok"] = response.status < 400
+        result["final_url"] = str(response.url)
+        result["redirects"] = [
+            {"url": str(hop.url), "status": hop.status} for hop in response.history
+        ]
+
+    async def check_all_links(
+        self,
+        category: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> int:
+        """Check every README link and write a health report; returns broken count."""
+        print("📚 Extracting links from README.md...")
+        links = self.extract_links_from_readme()
+
+        if category:
+            links = [l for l in links if category.lower() in l["category"].lower()]
+            print(f"   Filtered to category: {category}")
+
+        if limit:
+            links = links[:limit]
+            print(f"   Limited to {limit} links")
+
+        # The same URL can appear in several sections; check it once
+        links = unique_links(links)
+        print(f"   Found {len(links)} links to check\n")
+
+        print("🩺 Checking links...")
+        tasks = [self.check_link(link) for link in links]
+        results = await asyncio.gather(*tasks)
+
+        by_category = {}
+        for link, result in zip(links, results):
+            by_category.setdefault(link["category"], []).append(result)
+
+        summary = {
+            "total": len(results),
+            "ok": sum(1 for r in results if r["ok"]),
+            "broken": sum(1 for r in results if not r["ok"]),
+            "redirected": sum(1 for r in results if r["redirects"])
+        }
+        report = {
+            "generated": datetime.now().isoformat(),
+            "summary": summary,
+            "categories": {cat: by_category[cat] for cat in sorted(by_category)}
+        }
+
+        CONTENT_DIR.mkdir(parents=True, exist_ok=True)
+        with open(LINK_HEALTH_PATH, 'w') as f:
+            json.dump(report, f, indent=2)
+
+        print("\n📊 Link Health Summary:")
+        print(f"   ✅ OK:         {summary['ok']}")
+        print(f"   ↪️  Redirected: {summary['redirected']}")
+        print(f"   ❌ Broken:     {summary['broken']}")
+        print(f"\n📋 Link health report: {LINK_HEALTH_PATH}")
+        return summary["broken"]
+
+
+def unique_links(links: list[dict]) -> list[dict]:
+    """Drop repeated ids (a URL listed in several sections); first occurrence wins."""
+    unique = {}
+    for link in links:
+        unique.setdefault(link["id"], link)
+    return list(unique.values())
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parse a `--shard i/N` argument into (index, count)."""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{value}', expected i/N")
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{value}', need 0 <= i < N")
+    return index, count
+
+
+def shard_of(link_id: str, count: int) -> int:
+    """Map a link id to its shard; stable across processes and machines."""
+    digest = hashlib.sha1(link_id.encode()).digest()
+    return int.from_bytes(digest[:8], 'big') % count
+
+
+def write_shard_fragment(
+    shard: tuple[int, int],
+    index: dict,
+    stats: dict,
+    failed_urls: list[dict],
+    removed_ids: list[str],
+    manifest: Optional[dict] = None
+) -> Path:
+    """Write one shard's index entries, stats, failures and README link set."""
+    shard_index, shard_count = shard
+    fragment = {
+        "shard": shard_index,
+        "shards": shard_count,
+        "finished_at": datetime.now().isoformat(),
+        # Only entries owned by this shard (followed pages go with their seed),
+        # so fragments never overlap
+        "index": {
+            k: v for k, v in index.items()
+            if shard_of(v.get("seed", k), shard_count) == shard_index
+        },
+        "stats": stats,
+        "failed_urls": failed_urls,
+        "removed": removed_ids,
+        "manifest": manifest
+    }
+
+    SHARDS_DIR.mkdir(parents=True, exist_ok=True)
+    fragment_path = SHARDS_DIR / f"shard-{shard_index}-of-{shard_count}.json"
+    tmp_path = fragment_path.with_suffix(".json.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(fragment, f)
+    os.replace(tmp_path, fragment_path)
+    return fragment_path
+
+
+def merge_shards() -> bool:
+    """Combine shard fragments into index.json, metadata and failure report."""
+    fragment_paths = sorted(SHARDS_DIR.glob("shard-*-of-*.json"))
+    if not fragment_paths:
+        print(f"ERROR: No shard fragments found in {SHARDS_DIR}")
+        return False
+
+    fragments = []
+    for path in fragment_paths:
+        with open(path, 'r') as f:
+            fragments.append(json.load(f))
+
+    counts = {f["shards"] for f in fragments}
+    if len(counts) != 1:
+        print(f"ERROR: Fragments come from different shard counts: {sorted(counts)}")
+        return False
+
+    shard_count = counts.pop()
+    present = {f["shard"] for f in fragments}
+    missing = sorted(set(range(shard_count)) - present)
+    if missing:
+        print(f"⚠️  Warning: Missing shards {missing} of {shard_count}")
+
+    index = {}
+    if INDEX_PATH.exists():
+        with open(INDEX_PATH, 'r') as f:
+            index = json.load(f)
+
+    stats: dict = {}
+    failed_urls = []
+    for fragment in sorted(fragments, key=lambda f: f["shard"]):
+        index.update(fragment["index"])
+        for link_id in fragment.get("removed", []):
+            index.pop(link_id, None)
+        failed_urls.extend(fragment["failed_urls"])
+        for key, value in fragment["stats"].items():
+            stats[key] = stats.get(key, 0) + value
+
+    with open(INDEX_PATH, 'w') as f:
+        json.dump(index, f, indent=2)
+    write_compact_index(index)
+    clear_search_cache()
+
+    # Record the README link set only once every shard has applied its changes
+    manifests = [f.get("manifest") for f in fragments]
+    if all(manifests) and not missing:
+        hashes = {m["readme_sha256"] for m in manifests}
+        if len(hashes) == 1:
+            write_link_manifest(manifests[0]["readme_sha256"], manifests[0]["links"])
+        else:
+            print("⚠️  Warning: Shards saw different README versions; link manifest not updated")
+    elif any(manifests):
+        print("⚠️  Warning: Not every shard finished an incremental run; link manifest not updated")
+
+    write_metadata(index, stats)
+
+    print(f"🧩 Merged {len(fragments)} of {shard_count} shard fragments")
+    if failed_urls:
+        report_path = write_failure_report(failed_urls)
+        print(f"\n⚠️  Failed URLs report saved to: {report_path}")
+
+    print_summary(stats, failed_urls)
+    print(f"\n📁 Content saved to: {CONTENT_DIR}")
+
+    for path in fragment_paths:
+        path.unlink()
+    if not any(SHARDS_DIR.iterdir()):
+        SHARDS_DIR.rmdir()
+    return True
+
+
+def write_link_manifest(readme_hash: str, links: list[dict]):
+    """Record the current README link set for the next incremental run."""
+    manifest = {
+        "readme_sha256": readme_hash,
+        "generated_at": datetime.now().isoformat(),
+        "links": links
+    }
+    tmp_path = LINK_MANIFEST_PATH.with_suffix(".json.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, LINK_MANIFEST_PATH)
+
+
+def write_metadata(index: dict, stats: dict):
+    """Save crawl metadata."""
+    metadata = {
+        "last_crawl": datetime.now().isoformat(),
+        "total_resources": len(index),
+        "categories": list(set(v["category"] for v in index.values())),
+        "stats": stats
+    }
+    with open(METADATA_PATH, 'w') as f:
+        yaml.dump(metadata, f)
+
+
+def write_failure_report(failed_urls: list[dict]) -> Path:
+    """Write failed URLs grouped by category."""
+    report_path = CONTENT_DIR / "failed_urls_report.md"
+    with open(report_path, 'w') as f:
+        f.write("# Failed URLs Report\n\n")
+        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        f.write(f"Total Failed: {len(failed_urls)}\n\n")
+        f.write("---\n\n")
+        
+        # Group by category
+        by_category = {}
+        for failed in failed_urls:
+            category = failed.get('category', 'Unknown')
+            if category not in by_category:
+                by_category[category] = []
+            by_category[category].append(failed)
+        
+        for category, failures in sorted(by_category.items()):
+            f.write(f"## {category}\n\n")
+            for failed in failures:
+                f.write(f"### {failed.get('title', 'Unknown Title')}\n\n")
+                f.write(f"- **URL**: {failed['url']}\n")
+                f.write(f"- **Error**: {failed.get('error', 'Unknown error')}\n")
+                if failed.get('subcategory'):
+                    f.write(f"- **Subcategory**: {failed['subcategory']}\n")
+                f.write(f"- **Timestamp**: {failed.get('timestamp', 'N/A')}\n")
+                f.write("\n")
+    return report_path
+
+
+def print_summary(stats: dict, failed_urls: list[dict]):
+    """Print crawl summary."""
+    print("\n📊 Crawl Summary:")
+    print(f"   ✅ Success: {stats['success']}")
+    print(f"   ⏭️  Skipped: {stats['skipped']}")
+    print(f"   ❌ Failed:  {stats['failed']}")
+
+    if stats.get("write_files"):
+        seconds = stats.get("write_seconds") or 1e-9
+        print("\n💾 Writes:")
+        print(f"   {stats['write_files']} files, {stats['write_bytes'] / 1024 / 1024:.2f} MB "
+              f"in {stats['write_batches']} batches")
+        print(f"   {stats['write_files'] / seconds:.0f} files/s, "
+              f"{stats['write_bytes'] / 1024 / 1024 / seconds:.1f} MB/s")
+        if stats.get("write_file_fsyncs"):
+            # Durability is not free: one disk flush per document
+            print(f"   {stats['write_file_fsyncs']} file fsyncs + "
+                  f"{stats['write_dir_fsyncs']} directory fsyncs "
+                  "(--host-sync: one os.sync per batch instead)")
+        elif stats.get("write_host_syncs"):
+            print(f"   {stats['write_host_syncs']} host-wide syncs + "
+                  f"{stats['write_dir_fsyncs']} directory fsyncs")
+
+    if stats.get("frontier_queued") is not None:
+        print("\n🔗 Followed Links:")
+        print(f"   Discovered:   {stats['frontier_discovered']}")
+        print(f"   Queued:       {stats['frontier_queued']}")
+        print(f"   Duplicates:   {stats['frontier_duplicates']}")
+        print(f"   Out of scope: {stats['frontier_out_of_scope']}")
+        print(f"   Over budget:  {stats['frontier_over_budget']}")
+
+    if "links_added" in stats:
+        print("\n🔀 README Changes:")
+        print(f"   Added:    {stats['links_added']}")
+        print(f"   Removed:  {stats['links_removed']}")
+        print(f"   Moved:    {stats['links_moved']}")
+        print(f"   Retitled: {stats['links_retitled']}")
+
+    connections = stats.get("connections_new", 0) + stats.get("connections_reused", 0)
+    if connections:
+        reuse_ratio = stats.get("connections_reused", 0) / connections
+        print("\n🔌 Connections:")
+        print(f"   Requests:       {stats.get('requests', 0)}")
+        print(f"   New / reused:   {stats.get('connections_new', 0)} / "
+              f"{stats.get('connections_reused', 0)} ({reuse_ratio:.0%} reused)")
+        print(f"   TLS handshakes: {stats.get('tls_handshakes', 0)}")
+        print(f"   DNS lookups:    {stats.get('dns_lookups', 0)} "
+              f"({stats.get('dns_cache_hits', 0)} cache hits)")
+    if failed_urls:
+        print(f"\n📋 Failed URLs Report: {CONTENT_DIR / 'failed_urls_report.md'}")
 
 
 async def main():
@@ -511,20 +1164,141 @@ async def main():
         action="store_true",
         help="Update existing content"
     )
+    parser.add_argument(
+        "--follow-depth",
+        type=int,
+        default=0,
+        help="Follow same-site links from crawled pages up to this depth (default: 0, off)"
+    )
+    parser.add_argument(
+        "--max-pages-per-seed",
+        type=int,
+        default=DEFAULT_MAX_PAGES_PER_SEED,
+        help=f"Page budget per README link when following links (default: {DEFAULT_MAX_PAGES_PER_SEED})"
+    )
+    parser.add_argument(
+        "--check-links",
+        action="store_true",
+        help="Check README links with HEAD requests and write "
+             "content/link_health.json; nothing is downloaded or saved"
+    )
+    parser.add_argument(
+        "--incremental", "-i",
+        action="store_true",
+        help="Diff README links against the last run: fetch added links, "
+             "relocate moved ones and prune removed ones"
+    )
+    parser.add_argument(
+        "--allow-mass-removal",
+        action="store_true",
+        help="With --incremental, prune removed links even when they are more "
+             f"than {MAX_REMOVED_FRACTION:.0%} of the known links"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help=f"Maximum concurrent requests (default: {MAX_CONCURRENT_REQUESTS}, "
+             f"or {CHECK_CONCURRENCY} with --check-links)"
+    )
+    parser.add_argument(
+        "--limit-per-host",
+        type=int,
+        default=CONNECTION_LIMIT_PER_HOST,
+        help=f"Maximum open connections per host (default: {CONNECTION_LIMIT_PER_HOST})"
+    )
+    parser.add_argument(
+        "--dns-ttl",
+        type=int,
+        default=DNS_CACHE_TTL,
+        help=f"DNS cache TTL in seconds (default: {DNS_CACHE_TTL})"
+    )
+    parser.add_argument(
+        "--keepalive",
+        type=float,
+        default=KEEPALIVE_TIMEOUT,
+        help=f"Idle keep-alive timeout in seconds (default: {KEEPALIVE_TIMEOUT})"
+    )
+    parser.add_argument(
+        "--html-engine",
+        choices=ENGINES,
+        default=DEFAULT_ENGINE,
+        help="HTML extraction engine; 'legacy' is the original "
+             f"parse/serialize/re-parse path (default: {DEFAULT_ENGINE})"
+    )
+    parser.add_argument(
+        "--host-sync",
+        action="store_true",
+        help="Flush each write batch with one host-wide sync instead of an "
+             "fsync per file (flushes every filesystem on the machine)"
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        metavar="I/N",
+        help="Crawl only shard I of N (links partitioned by id hash)"
+    )
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="Merge shard fragments into index.json and reports"
+    )
+    add_profile_argument(parser)
     
     args = parser.parse_args()
 
-    print("=" * 50)
-    print("  Programming Best Practices Crawler")
-    print("=" * 50)
-    print()
+    # Concurrent shards on one machine must not overwrite each other's report
+    profile_name = "crawl"
+    if args.shard:
+        profile_name = f"crawl-shard-{args.shard[0]}-of-{args.shard[1]}"
+    elif args.merge:
+        profile_name = "crawl-merge"
+    elif args.check_links:
+        profile_name = "crawl-check-links"
 
-    async with ContentCrawler() as crawler:
-        await crawler.crawl_all(
-            category=args.category,
-            limit=args.limit,
-            update=args.update
-        )
+    concurrency = args.concurrency
+    if concurrency is None:
+        concurrency = CHECK_CONCURRENCY if args.check_links else MAX_CONCURRENT_REQUESTS
+
+    with maybe_profile(profile_name, CONTENT_DIR, args.profile) as profiler:
+        if args.merge:
+            if not merge_shards():
+                exit(1)
+            return
+
+        print("=" * 50)
+        print("  Programming Best Practices Crawler")
+        print("=" * 50)
+        print()
+
+        async with ContentCrawler(
+            max_concurrent=concurrency,
+            connection_limit_per_host=args.limit_per_host,
+            dns_cache_ttl=args.dns_ttl,
+            keepalive_timeout=args.keepalive,
+            html_engine=args.html_engine,
+            host_sync=args.host_sync,
+            profiler=profiler
+        ) as crawler:
+            if args.check_links:
+                broken = await crawler.check_all_links(
+                    category=args.category,
+                    limit=args.limit
+                )
+                if broken:
+                    exit(1)
+                return
+
+            if not await crawler.crawl_all(
+                category=args.category,
+                limit=args.limit,
+                update=args.update,
+                shard=args.shard,
+                incremental=args.incremental,
+                follow_depth=args.follow_depth,
+                max_pages_per_seed=args.max_pages_per_seed,
+                allow_mass_removal=args.allow_mass_removal
+            ):
+                exit(1)
 
 
 if __name__ == "__main__":
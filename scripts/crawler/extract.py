@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+HTML to markdown extraction engines.
+
+The legacy engine parses a page with `html.parser`, walks it once per removed
+tag type and once per content selector, serializes the chosen subtree back to
+HTML and lets `markdownify` parse it a second time. The fast engine parses
+once (with lxml when it is installed), finds the tags to drop, the main
+content, title and description in a single traversal, and converts the
+chosen subtree to markdown directly from the parsed tree.
+
+Usage:
+    python extract.py compare                  # Compare engines on the fixtures
+    python extract.py compare page.html dir/   # Compare on other HTML files
+"""
+
+import re
+import time
+import argparse
+from pathlib import Path
+from typing import Optional
+
+try:
+    from bs4 import BeautifulSoup, Tag
+    from bs4.builder import builder_registry
+    from markdownify import MarkdownConverter, markdownify as md
+except ImportError as e:
+    print(f"Missing dependency: {e}")
+    print("Please run: pip install -r requirements.txt")
+    exit(1)
+
+
+SCRIPT_DIR = Path(__file__).parent
+FIXTURES_DIR = SCRIPT_DIR / "fixtures" / "html"
+
+ENGINES = ["fast", "legacy"]
+DEFAULT_ENGINE = "fast"
+
+# lxml is an optional speed-up; html.parser ships with Python
+FAST_PARSER = "lxml" if builder_registry.lookup("lxml") else "html.parser"
+
+REMOVE_TAGS = ['script', 'style', 'nav', 'footer', 'header', 'aside']
+# Main content candidates, most preferred first
+CONTENT_SELECTORS = ['article', 'main', '.content', '.post-content', '.markdown-body', '#content']
+
+_converter = MarkdownConverter(heading_style="ATX")
+
+
+def extract_legacy(html: str) -> dict:
+    """Original extraction path: parse, serialize the subtree, re-parse."""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # Remove unwanted elements
+    for tag in soup.find_all(REMOVE_TAGS):
+        tag.decompose()
+
+    # Try to find main content
+    main_content = None
+    for selector in CONTENT_SELECTORS:
+        main_content = soup.select_one(selector)
+        if main_content:
+            break
+
+    if not main_content:
+        main_content = soup.body if soup.body else soup
+
+    # Convert to markdown
+    markdown_content = md(str(main_content), heading_style="ATX")
+
+    # Get title
+    title = ""
+    if soup.title:
+        title = soup.title.string or ""
+    elif soup.h1:
+        title = soup.h1.get_text()
+
+    # Get description
+    description = ""
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    if meta_desc:
+        description = meta_desc.get('content', '')
+
+    return {
+        "content": markdown_content,
+        "title": title,
+        "description": description
+    }
+
+
+def _selector_rank(tag: Tag) -> Optional[int]:
+    """Rank of the most preferred CONTENT_SELECTORS entry matching `tag`."""
+    classes = tag.get('class') or ()
+    tag_id = tag.get('id')
+    for rank, selector in enumerate(CONTENT_SELECTORS):
+        if selector[0] == '.':
+            if selector[1:] in classes:
+                return rank
+        elif selector[0] == '#':
+            if tag_id == selector[1:]:
+                return rank
+        elif tag.name == selector:
+            return rank
+    return None
+
+
+def extract_fast(html: str, parser: str = FAST_PARSER) -> dict:
+    """Single-parse extraction; output matches `extract_legacy`."""
+    soup = BeautifulSoup(html, parser)
+
+    remove = []
+    candidates: dict = {}  # selector rank -> first matching tag
+    title_tag = body = h1 = meta_desc = None
+
+    # One pre-order walk in document order; removed subtrees are not entered,
+    # exactly as if they had been decomposed before searching
+    stack = [soup]
+    while stack:
+        node = stack.pop()
+        name = node.name
+
+        if name in REMOVE_TAGS:
+            remove.append(node)
+            continue
+
+        if name == 'title':
+            title_tag = title_tag or node
+        elif name == 'body':
+            body = body or node
+        elif name == 'h1':
+            h1 = h1 or node
+        elif name == 'meta' and meta_desc is None and node.get('name') == 'description':
+            meta_desc = node
+
+        rank = _selector_rank(node)
+        if rank is not None and rank not in candidates:
+            candidates[rank] = node
+
+        stack.extend(child for child in reversed(node.contents) if isinstance(child, Tag))
+
+    for tag in remove:
+        tag.decompose()
+
+    if candidates:
+        main_content = candidates[min(candidates)]
+    else:
+        main_content = body if body else soup
+
+    # Convert the parsed subtree directly; strip like markdownify does for documents
+    markdown_content = _converter.convert_soup(main_content).strip('\n')
+
+    title = ""
+    if title_tag:
+        title = title_tag.string or ""
+    elif h1:
+        title = h1.get_text()
+
+    description = meta_desc.get('content', '') if meta_desc else ""
+
+    return {
+        "content": markdown_content,
+        "title": title,
+        "description": description
+    }
+
+
+def extract_html(html: str, engine: str = DEFAULT_ENGINE) -> dict:
+    """Extract markdown content, title and description from an HTML page."""
+    if engine == "legacy":
+        return extract_legacy(html)
+    return extract_fast(html)
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def _html_files(paths: list[Path]) -> list[Path]:
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(path.glob("*.htm*")))
+        else:
+            files.append(path)
+    return files
+
+
+def compare_engines(paths: list[Path]) -> bool:
+    """Check the fast engine against the legacy one; returns True if equivalent.
+
+    With the same parser the two engines must agree exactly. Differences that
+    only appear with lxml come from the parser, not the engine, and are shown
+    as warnings.
+    """
+    files = _html_files(paths)
+    if not files:
+        print("No HTML files to compare.")
+        return False
+
+    print(f"Comparing engines on {len(files)} file(s) (fast parser: {FAST_PARSER})\n")
+    equivalent = True
+    timings = {"legacy": 0.0, "fast": 0.0}
+
+    for path in files:
+        html = path.read_text(encoding='utf-8', errors='replace')
+
+        start = time.perf_counter()
+        legacy = extract_legacy(html)
+        timings["legacy"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        fast = extract_fast(html)
+        timings["fast"] += time.perf_counter() - start
+
+        # Same parser must give byte-identical output
+        same_parser = extract_fast(html, parser='html.parser') == legacy
+        # Across parsers, compare with whitespace collapsed
+        normalized = all(
+            _normalize(str(fast[key])) == _normalize(str(legacy[key]))
+            for key in legacy
+        )
+
+        if not same_parser:
+            status = "❌"
+        elif not normalized:
+            # lxml repairs malformed markup (e.g. unclosed <li>) differently
+            status = "⚠️ "
+        else:
+            status = "✅"
+        print(f"{status} {path.name}: identical={same_parser}, "
+              f"equivalent with {FAST_PARSER}={normalized}")
+        equivalent = equivalent and same_parser
+
+    print(f"\nlegacy: {timings['legacy'] * 1000:.1f} ms, fast: {timings['fast'] * 1000:.1f} ms")
+    return equivalent
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="HTML extraction engines"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    compare_parser = subparsers.add_parser(
+        "compare", help="Check the fast engine against the legacy one"
+    )
+    compare_parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        default=[FIXTURES_DIR],
+        help="HTML files or directories (default: fixtures/html)"
+    )
+
+    args = parser.parse_args()
+
+    if not compare_engines(args.paths):
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
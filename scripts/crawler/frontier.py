@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Depth-limited crawl frontier for following links out of crawled pages.
+
+Many resources linked from the README are multi-page guides whose first page
+is only a table of contents. The frontier takes links found in fetched
+documents, keeps those that stay inside the seed's scope (same host, under
+the seed's directory, or files on any branch of a GitHub repo seed), and
+hands them back in priority order: shallower pages first, then discovery
+order. Each seed has a page budget, and URLs are deduplicated with a Bloom
+filter so hundreds of thousands of discovered URLs cost a few megabytes
+rather than a set of strings.
+"""
+
+import re
+import math
+import heapq
+import hashlib
+from typing import Optional
+from urllib.parse import urljoin, urlparse, urlunparse, parse_qsl, urlencode
+
+
+DEFAULT_MAX_PAGES_PER_SEED = 50
+DEFAULT_CAPACITY = 1_000_000  # URLs the visited set is sized for
+DEFAULT_ERROR_RATE = 0.001  # chance a new URL is mistaken for a visited one
+
+# [text](url) and [text](url "title"), but not images ![alt](src)
+MARKDOWN_LINK = re.compile(r'(?<!!)\[([^\]]*)\]\(<?([^)\s>]+)>?(?:\s+"[^"]*")?\)')
+DEFAULT_PORTS = {"http": 80, "https": 443}
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid")
+# Not worth following: binaries, images and archives
+SKIP_EXTENSIONS = (
+    ".png", ".jpg", ".jpeg", ".gif", ".svg", ".ico", ".webp", ".pdf",
+    ".zip", ".tar", ".gz", ".tgz", ".exe", ".dmg", ".mp4", ".mp3"
+)
+
+
+def normalize_url(url: str, base: Optional[str] = None) -> Optional[str]:
+    """Canonical form of a URL for deduplication, or None if not crawlable."""
+    try:
+        if base:
+            url = urljoin(base, url)
+        parsed = urlparse(url)
+        scheme = parsed.scheme.lower()
+        if scheme not in DEFAULT_PORTS or not parsed.hostname:
+            return None
+        port = parsed.port
+    except ValueError:
+        # e.g. placeholder ports (http://localhost:PORT/) or broken IPv6 hosts
+        return None
+
+    host = parsed.hostname.lower()
+    if port and port != DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if not k.startswith(TRACKING_PARAMS)
+    ))
+    # Fragments point into the same document
+    return urlunparse((scheme, host, parsed.path or "/", "", query, ""))
+
+
+def _github_repo(url: str) -> Optional[tuple[str, str]]:
+    """(owner, repo) if `url` is a GitHub repository root, else None."""
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return None
+    parts = parsed.path.strip('/').split('/')
+    if parsed.hostname == "github.com" and len(parts) == 2 and all(parts):
+        return parts[0], parts[1]
+    return None
+
+
+def link_base(url: str) -> str:
+    """URL that relative links in a document resolve against."""
+    repo = _github_repo(url)
+    # The crawler stores a repo's README; its links are relative to the tree
+    if repo:
+        return f"https://github.com/{repo[0]}/{repo[1]}/blob/HEAD/"
+    return url
+
+
+def link_scope(url: str) -> str:
+    """Prefix a discovered URL must start with to stay within a seed."""
+    repo = _github_repo(url)
+    if repo:
+        # Files on any branch of the repo; see in_scope
+        return f"https://github.com/{repo[0]}/{repo[1]}/"
+    normalized = normalize_url(link_base(url)) or url
+    return normalized.split('?', 1)[0].rsplit('/', 1)[0] + '/'
+
+
+def in_scope(url: str, scope: str) -> bool:
+    """Whether normalized `url` stays within a seed's `scope`."""
+    if not url.startswith(scope):
+        return False
+    if _github_repo(scope):
+        # Files on any branch, not issues, releases etc. Directory (tree/)
+        # pages are left out: fetch_content would store the repo README again
+        return url[len(scope):].startswith("blob/")
+    return True
+
+
+class BloomFilter:
+    """Fixed-size probabilistic set of strings; never gives false negatives."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, error_rate: float = DEFAULT_ERROR_RATE):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value: str):
+        digest = hashlib.blake2b(value.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, value: str) -> bool:
+        """Add `value`; returns False if it was (probably) already present."""
+        added = False
+        for position in self._positions(value):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self.bits[position // 8] & (1 << (position % 8))
+            for position in self._positions(value)
+        )
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class Frontier:
+    """Priority queue of same-site links discovered in crawled documents."""
+
+    def __init__(
+        self,
+        max_depth: int,
+        max_pages_per_seed: int = DEFAULT_MAX_PAGES_PER_SEED,
+        capacity: int = DEFAULT_CAPACITY
+    ):
+        self.max_depth = max_depth
+        self.max_pages_per_seed = max_pages_per_seed
+        self.visited = BloomFilter(capacity)
+        self.pages: dict = {}  # seed id -> pages queued for that seed
+        self.stats = {
+            "discovered": 0,
+            "queued": 0,
+            "duplicates": 0,
+            "out_of_scope": 0,
+            "over_budget": 0
+        }
+        self._heap: list = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def mark_visited(self, url: str):
+        """Record a URL (e.g. a README seed) so it is never queued."""
+        normalized = normalize_url(url)
+        if normalized:
+            self.visited.add(normalized)
+
+    def discover(self, parent: dict, markdown: str) -> int:
+        """Queue in-scope links found in `parent`'s markdown; returns how many."""
+        depth = parent.get("depth", 0) + 1
+        if depth > self.max_depth:
+            return 0
+
+        seed = parent.get("seed", parent["id"])
+        scope = parent.get("scope") or link_scope(parent["url"])
+        base = link_base(parent["url"])
+        queued = 0
+
+        for match in MARKDOWN_LINK.finditer(markdown):
+            href = match.group(2)
+            if href.startswith('#'):
+                # Anchor within the page itself
+                continue
+            self.stats["discovered"] += 1
+            url = normalize_url(href, base)
+            if not url or not in_scope(url, scope) or url.lower().endswith(SKIP_EXTENSIONS):
+                self.stats["out_of_scope"] += 1
+                continue
+            if self.pages.get(seed, 0) >= self.max_pages_per_seed:
+                self.stats["over_budget"] += 1
+                continue
+            if not self.visited.add(url):
+                self.stats["duplicates"] += 1
+                continue
+
+            self.pages[seed] = self.pages.get(seed, 0) + 1
+            self._seq += 1
+            heapq.heappush(self._heap, (depth, self._seq, {
+                "title": match.group(1).strip() or url,
+                "url": url,
+                "category": parent["category"],
+                "subcategory": parent["subcategory"],
+                "seed": seed,
+                "depth": depth,
+                "scope": scope
+            }))
+            queued += 1
+
+        self.stats["queued"] += queued
+        return queued
+
+    def pop_batch(self, size: int) -> list[dict]:
+        """Take up to `size` links, shallowest first."""
+        batch = []
+        while self._heap and len(batch) < size:
+            batch.append(heapq.heappop(self._heap)[2])
+        return batch
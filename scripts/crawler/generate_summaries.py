@@ -8,6 +8,7 @@ organized by category for quick context loading.
 Usage:
     python generate_summaries.py              # Generate all summaries
     python generate_summaries.py --category python  # Generate for specific category
+    python generate_summaries.py --profile          # Write a CPU/memory profile report
 """
 
 import os
@@ -16,6 +17,7 @@ import json
 import argparse
 from pathlib import Path
 from datetime import datetime
+from collections.abc import Mapping
 from typing import Optional
 
 try:
@@ -24,6 +26,10 @@ except ImportError:
     print("Missing PyYAML. Run: pip install pyyaml")
     exit(1)
 
+from compact_index import load_compact_index
+from pack import open_pack, read_document
+from profiling import add_profile_argument, maybe_profile
+
 
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent
@@ -32,8 +38,12 @@ SUMMARIES_DIR = PROJECT_ROOT / "summaries"
 INDEX_PATH = CONTENT_DIR / "index.json"
 
 
-def load_index() -> dict:
-    """Load the content index."""
+def load_index() -> Mapping:
+    """Load the content index, preferring the compact binary form."""
+    compact = load_compact_index()
+    if compact is not None:
+        return compact
+    
     if not INDEX_PATH.exists():
         print("Error: Index not found. Run 'python crawl.py' first.")
         return {}
@@ -70,7 +80,7 @@ def extract_key_points(content: str, max_points: int = 10) -> list[str]:
     return points
 
 
-def generate_category_summary(category: str, items: list[dict]) -> str:
+def generate_category_summary(category: str, items: list[dict], pack=None) -> str:
     """Generate a summary for a category."""
     summary_parts = [
         f"# {category} Best Practices Summary",
@@ -85,12 +95,10 @@ def generate_category_summary(category: str, items: list[dict]) -> str:
     for item in items:
         file_path = PROJECT_ROOT / item["file"]
         
-        if not file_path.exists():
-            continue
-        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = read_document(item["file"], pack)
+            if content is None:
+                continue
             
             # Remove frontmatter
             if content.startswith('---'):
@@ -115,7 +123,7 @@ def generate_category_summary(category: str, items: list[dict]) -> str:
     return "\n".join(summary_parts)
 
 
-def generate_master_summary(index: dict) -> str:
+def generate_master_summary(index: Mapping) -> str:
     """Generate a master summary of all content."""
     categories = {}
     
@@ -160,17 +168,8 @@ def generate_master_summary(index: dict) -> str:
     return "\n".join(summary_parts)
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Generate AI-ready summaries from crawled content"
-    )
-    parser.add_argument(
-        "--category", "-c",
-        help="Generate summary for specific category only"
-    )
-    
-    args = parser.parse_args()
-    
+def generate_all(category: Optional[str] = None):
+    """Generate category summaries and, unless filtered, the master summary."""
     print("📝 Generating Summaries...")
     print()
     
@@ -189,19 +188,22 @@ def main():
         categories[cat].append({**item, "id": id})
     
     # Filter if category specified
-    if args.category:
+    if category:
         categories = {
             k: v for k, v in categories.items()
-            if args.category.lower() in k.lower()
+            if category.lower() in k.lower()
         }
         if not categories:
-            print(f"No category matching '{args.category}'")
+            print(f"No category matching '{category}'")
             return
     
+    # Documents may live in a content pack instead of loose files
+    pack = open_pack()
+
     # Generate category summaries
     for cat, items in categories.items():
         print(f"  Generating: {cat}...")
-        summary = generate_category_summary(cat, items)
+        summary = generate_category_summary(cat, items, pack)
         
         # Sanitize filename: replace slashes and other problematic characters
         filename = cat.lower().replace(' ', '_').replace('&', 'and').replace('/', '_') + ".md"
@@ -210,8 +212,11 @@ def main():
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(summary)
     
+    if pack:
+        pack.close()
+    
     # Generate master summary
-    if not args.category:
+    if not category:
         print("  Generating: Master Summary...")
         master = generate_master_summary(index)
         
@@ -222,5 +227,21 @@ def main():
     print(f"✅ Summaries saved to: {SUMMARIES_DIR}")
 
 
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate AI-ready summaries from crawled content"
+    )
+    parser.add_argument(
+        "--category", "-c",
+        help="Generate summary for specific category only"
+    )
+    add_profile_argument(parser)
+    
+    args = parser.parse_args()
+    
+    with maybe_profile("generate_summaries", SUMMARIES_DIR, args.profile):
+        generate_all(args.category)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Pack and unpack crawled content into compressed, memory-mapped shards.
+
+A pack stores every crawled `.md` document compressed individually inside a
+small number of shard files, plus a manifest with the offset and length of
+each document. Readers mmap the shards and decompress a single document on
+demand, so shipping the knowledge base no longer means shipping thousands of
+uncompressed files.
+
+Usage:
+    python pack.py pack                  # Pack content/ into content/packs/
+    python pack.py pack --remove         # Pack and delete the packed .md files
+    python pack.py pack --codec zstd     # Use zstd (requires zstandard)
+    python pack.py unpack                # Restore .md files missing from content/
+    python pack.py unpack --force        # Also overwrite existing .md files
+    python pack.py list                  # Show pack contents
+"""
+
+import os
+import json
+import mmap
+import zlib
+import argparse
+from pathlib import Path
+from typing import Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent.parent
+CONTENT_DIR = PROJECT_ROOT / "content"
+INDEX_PATH = CONTENT_DIR / "index.json"
+PACK_DIR = CONTENT_DIR / "packs"
+MANIFEST_PATH = PACK_DIR / "manifest.json"
+
+PACK_VERSION = 1
+SHARD_MAGIC = b"PBPPACK1"
+DEFAULT_SHARD_SIZE = 64 * 1024 * 1024  # bytes of compressed data per shard
+ZLIB_LEVEL = 9
+ZSTD_LEVEL = 19
+
+
+def available_codecs() -> list[str]:
+    """Return the codecs usable in this environment."""
+    codecs = ["zlib"]
+    if zstandard is not None:
+        codecs.append("zstd")
+    return codecs
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zlib":
+        return zlib.compress(data, ZLIB_LEVEL)
+    if codec == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    raise ValueError(f"Unsupported codec: {codec}")
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zlib":
+        return zlib.decompress(data)
+    if codec == "zstd" and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unsupported codec: {codec}")
+
+
+class PackWriter:
+    """Writes documents into size-bounded shard files and a manifest.
+
+    Shards get names no earlier pack used, and the manifest is swapped in
+    only after they are complete, so an interrupted repack leaves the
+    previous pack readable. Shards the new manifest no longer lists are
+    deleted after the swap.
+    """
+
+    def __init__(
+        self,
+        pack_dir: Path = PACK_DIR,
+        codec: str = "zlib",
+        shard_size: int = DEFAULT_SHARD_SIZE
+    ):
+        if codec not in available_codecs():
+            raise ValueError(f"Codec '{codec}' is not available")
+        self.pack_dir = pack_dir
+        self.codec = codec
+        self.shard_size = shard_size
+        self.shards: list[str] = []
+        self.documents: dict = {}
+        self._handle = None
+        self._offset = 0
+        self._generation = os.urandom(4).hex()
+
+    def __enter__(self):
+        self.pack_dir.mkdir(parents=True, exist_ok=True)
+        return self
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _open_shard(self):
+        if self._handle:
+            self._handle.close()
+        name = f"shard-{self._generation}-{len(self.shards):04d}.pack"
+        self.shards.append(name)
+        self._handle = open(self.pack_dir / name, 'wb')
+        self._handle.write(SHARD_MAGIC)
+        self._offset = len(SHARD_MAGIC)
+
+    def add(self, key: str, data: bytes):
+        """Compress and append one document under `key`."""
+        self.add_compressed(key, _compress(data, self.codec), len(data))
+
+    def add_compressed(self, key: str, blob: bytes, raw_length: int):
+        """Append a document already compressed with this writer's codec."""
+        if self._handle is None or (
+            self._offset > len(SHARD_MAGIC)
+            and self._offset + len(blob) > self.shard_size
+        ):
+            self._open_shard()
+
+        self._handle.write(blob)
+        # [shard, offset, compressed length, uncompressed length]
+        self.documents[key] = [len(self.shards) - 1, self._offset, len(blob), raw_length]
+        self._offset += len(blob)
+
+    def close(self):
+        """Flush the current shard, swap in the manifest and drop old shards."""
+        if self._handle:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+            self._handle.close()
+            self._handle = None
+
+        manifest = {
+            "version": PACK_VERSION,
+            "codec": self.codec,
+            "shards": self.shards,
+            "documents": self.documents
+        }
+        tmp_path = self.pack_dir / (MANIFEST_PATH.name + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.pack_dir / MANIFEST_PATH.name)
+
+        for old in self.pack_dir.glob("shard-*.pack"):
+            if old.name not in self.shards:
+                old.unlink()
+
+    def abort(self):
+        """Discard the shards written so far; the previous pack stays in place."""
+        if self._handle:
+            self._handle.close()
+            self._handle = None
+        for name in self.shards:
+            (self.pack_dir / name).unlink(missing_ok=True)
+
+
+class PackReader:
+    """Reads individual documents from memory-mapped pack shards."""
+
+    def __init__(self, pack_dir: Path = PACK_DIR):
+        self.pack_dir = pack_dir
+        with open(pack_dir / MANIFEST_PATH.name, 'r') as f:
+            manifest = json.load(f)
+
+        if manifest.get("version") != PACK_VERSION:
+            raise ValueError(f"Unsupported pack version: {manifest.get('version')}")
+
+        self.codec = manifest["codec"]
+        self.shards: list[str] = manifest["shards"]
+        self.documents: dict = manifest["documents"]
+        self._maps: dict = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.documents
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def keys(self):
+        return self.documents.keys()
+
+    def _map(self, shard: int) -> mmap.mmap:
+        # Shards are mapped lazily so a lookup touches only one file
+        mapped = self._maps.get(shard)
+        if mapped is None:
+            with open(self.pack_dir / self.shards[shard], 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if mapped[:len(SHARD_MAGIC)] != SHARD_MAGIC:
+                mapped.close()
+                raise ValueError(f"Not a pack shard: {self.shards[shard]}")
+            self._maps[shard] = mapped
+        return mapped
+
+    def read_bytes(self, key: str) -> Optional[bytes]:
+        """Decompress a single document, or return None if it is not packed."""
+        entry = self.documents.get(key)
+        if entry is None:
+            return None
+        return _decompress(self.read_compressed(key), self.codec)
+
+    def read_compressed(self, key: str) -> Optional[bytes]:
+        """Return a document's compressed blob as stored, or None if not packed."""
+        entry = self.documents.get(key)
+        if entry is None:
+            return None
+        shard, offset, length = entry[0], entry[1], entry[2]
+        return self._map(shard)[offset:offset + length]
+
+    def read_text(self, key: str) -> Optional[str]:
+        data = self.read_bytes(key)
+        return data.decode('utf-8') if data is not None else None
+
+    def close(self):
+        for mapped in self._maps.values():
+            mapped.close()
+        self._maps.clear()
+
+
+def open_pack(pack_dir: Path = PACK_DIR) -> Optional[PackReader]:
+    """Open the content pack if one exists."""
+    if not (pack_dir / MANIFEST_PATH.name).exists():
+        return None
+    try:
+        return PackReader(pack_dir)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not open content pack: {e}")
+        return None
+
+
+def read_document(rel_path: str, pack: Optional[PackReader] = None) -> Optional[str]:
+    """Read a document by its index `file` path, preferring the loose file."""
+    file_path = PROJECT_ROOT / rel_path
+    if file_path.exists():
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    if pack is not None:
+        return pack.read_text(Path(rel_path).as_posix())
+    return None
+
+
+def _document_paths() -> list[Path]:
+    """List crawled documents under content/, skipping the pack itself."""
+    return sorted(
+        p for p in CONTENT_DIR.glob("*/*.md")
+        if p.parent != PACK_DIR
+    )
+
+
+def _indexed_paths() -> Optional[set]:
+    """Document paths referenced by index.json, or None if there is no index."""
+    if not INDEX_PATH.exists():
+        return None
+    with open(INDEX_PATH, 'r') as f:
+        index = json.load(f)
+    return {Path(entry["file"]).as_posix() for entry in index.values() if entry.get("file")}
+
+
+def pack_content(codec: str, shard_size: int, remove: bool = False) -> int:
+    """Pack every crawled document into PACK_DIR."""
+    paths = _document_paths()
+    on_disk = {p.relative_to(PROJECT_ROOT).as_posix() for p in paths}
+
+    raw_size = 0
+    dropped = 0
+    existing = open_pack()
+    with PackWriter(PACK_DIR, codec=codec, shard_size=shard_size) as writer:
+        # Documents already packed but no longer on disk are carried over,
+        # unless the crawler has since pruned or relocated them
+        if existing:
+            indexed = _indexed_paths()
+            if indexed is None:
+                print("Warning: Index not found; carrying over every packed document")
+            with existing:
+                for key in sorted(existing.keys()):
+                    if key in on_disk:
+                        continue
+                    if indexed is not None and key not in indexed:
+                        dropped += 1
+                        continue
+                    raw_length = existing.documents[key][3]
+                    if existing.codec == codec:
+                        # Same codec: copy the compressed blob as is
+                        writer.add_compressed(key, existing.read_compressed(key), raw_length)
+                    else:
+                        writer.add(key, existing.read_bytes(key))
+                    raw_size += raw_length
+
+        for path in paths:
+            data = path.read_bytes()
+            writer.add(path.relative_to(PROJECT_ROOT).as_posix(), data)
+            raw_size += len(data)
+
+    packed_size = sum((PACK_DIR / s).stat().st_size for s in writer.shards)
+    print(f"📦 Packed {len(writer.documents)} documents into {len(writer.shards)} shard(s)")
+    print(f"   {raw_size:,} bytes -> {packed_size:,} bytes ({codec})")
+    if dropped:
+        print(f"   Dropped {dropped} packed documents no longer in the index")
+
+    if remove:
+        for path in paths:
+            path.unlink()
+        for directory in {p.parent for p in paths}:
+            if not any(directory.iterdir()):
+                directory.rmdir()
+        print(f"   Removed {len(paths)} loose files")
+
+    return len(writer.documents)
+
+
+def unpack_content(remove: bool = False, force: bool = False) -> int:
+    """Restore loose .md files from the pack.
+
+    Existing loose files are newer than (or the same as) their packed copy,
+    since the crawler writes loose files, so they are kept unless `force`.
+    """
+    pack = open_pack()
+    if not pack:
+        print("Error: No content pack found. Run 'python pack.py pack' first.")
+        return 0
+
+    count = skipped = 0
+    with pack:
+        for key in pack.keys():
+            file_path = PROJECT_ROOT / key
+            if file_path.exists() and not force:
+                skipped += 1
+                continue
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(pack.read_bytes(key))
+            count += 1
+        shards = list(pack.shards)
+
+    print(f"📂 Unpacked {count} documents to {CONTENT_DIR}")
+    if skipped:
+        print(f"   Kept {skipped} existing files (use --force to overwrite)")
+
+    if remove:
+        for shard in shards:
+            (PACK_DIR / shard).unlink()
+        MANIFEST_PATH.unlink()
+        if not any(PACK_DIR.iterdir()):
+            PACK_DIR.rmdir()
+        print("   Removed content pack")
+
+    return count
+
+
+def list_pack():
+    """Print a summary of the pack contents."""
+    pack = open_pack()
+    if not pack:
+        print("No content pack found.")
+        return
+
+    with pack:
+        raw = sum(entry[3] for entry in pack.documents.values())
+        compressed = sum(entry[2] for entry in pack.documents.values())
+        print(f"Codec:     {pack.codec}")
+        print(f"Shards:    {len(pack.shards)}")
+        print(f"Documents: {len(pack)}")
+        print(f"Size:      {raw:,} bytes -> {compressed:,} bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pack crawled content into compressed shards"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    pack_parser = subparsers.add_parser("pack", help="Pack content/ into shards")
+    pack_parser.add_argument(
+        "--codec",
+        choices=["zlib", "zstd"],
+        default="zlib",
+        help="Compression codec (default: zlib)"
+    )
+    pack_parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=DEFAULT_SHARD_SIZE // (1024 * 1024),
+        help="Maximum shard size in MB (default: 64)"
+    )
+    pack_parser.add_argument(
+        "--remove",
+        action="store_true",
+        help="Delete loose .md files after packing"
+    )
+
+    unpack_parser = subparsers.add_parser("unpack", help="Restore .md files from shards")
+    unpack_parser.add_argument(
+        "--remove",
+        action="store_true",
+        help="Delete the pack after unpacking"
+    )
+    unpack_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Overwrite existing .md files with their packed copy"
+    )
+
+    subparsers.add_parser("list", help="Show pack contents")
+
+    args = parser.parse_args()
+
+    if args.command == "pack":
+        if args.codec not in available_codecs():
+            print(f"Codec '{args.codec}' is not available. Run: pip install zstandard")
+            exit(1)
+        pack_content(args.codec, args.shard_size * 1024 * 1024, remove=args.remove)
+    elif args.command == "unpack":
+        unpack_content(remove=args.remove, force=args.force)
+    else:
+        list_pack()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Shared `--profile` support for the crawler, search and summary scripts.
+
+Profiling captures a cProfile CPU profile, wall-clock phase timings (which
+stay meaningful for the asyncio crawler, where cProfile attributes time to
+whichever coroutine happens to be resumed), tracemalloc top allocations and
+peak RSS, and writes a consolidated Markdown report plus a `.prof` file.
+
+When `--profile` is not given, `maybe_profile` returns a `nullcontext`:
+cProfile, pstats and tracemalloc are only imported once a `Profiler` is
+created, and nothing is started or sampled.
+"""
+
+import io
+import sys
+import time
+import argparse
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+TOP_FUNCTIONS = 30
+TOP_ALLOCATIONS = 20
+TRACEMALLOC_FRAMES = 1
+
+# Shared no-op context for callers that time phases only when profiling
+NO_PHASE = nullcontext()
+
+
+def add_profile_argument(parser: argparse.ArgumentParser):
+    """Add the shared `--profile` flag to a script's parser."""
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write a CPU/memory profile report next to the outputs"
+    )
+
+
+def maybe_profile(name: str, output_dir: Path, enabled: bool):
+    """Return a Profiler when enabled, otherwise a no-op context yielding None."""
+    if not enabled:
+        return nullcontext()
+    return Profiler(name, output_dir)
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _format_bytes(size: Optional[int]) -> str:
+    if size is None:
+        return "n/a"
+    for unit in ["B", "KB", "MB", "GB"]:
+        if size < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
+
+
+class Profiler:
+    """Collects CPU, wall-clock and memory data for one script run."""
+
+    def __init__(self, name: str, output_dir: Path):
+        self.name = name
+        self.output_dir = output_dir
+        self.phases: dict = {}  # name -> [total seconds, count, max seconds]
+        # Profilers are imported on use so runs without --profile never load them
+        import cProfile
+        self._profile = cProfile.Profile()
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+
+    def __enter__(self):
+        import tracemalloc
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self._profile.enable()
+        return self
+
+    def __exit__(self, *args):
+        import tracemalloc
+        self._profile.disable()
+        wall = time.perf_counter() - self._wall_start
+        cpu = time.process_time() - self._cpu_start
+        snapshot = tracemalloc.take_snapshot()
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        report_path = self._write_report(wall, cpu, snapshot, traced_peak)
+        print(f"\n⏱️  Profile report saved to: {report_path}", file=sys.stderr)
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block by wall clock; concurrent blocks accumulate."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            entry = self.phases.setdefault(name, [0.0, 0, 0.0])
+            entry[0] += elapsed
+            entry[1] += 1
+            entry[2] = max(entry[2], elapsed)
+
+    def _write_report(self, wall: float, cpu: float, snapshot, traced_peak: int) -> Path:
+        import pstats
+        import tracemalloc
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        prof_path = self.output_dir / f"{self.name}-profile.prof"
+        report_path = self.output_dir / f"{self.name}-profile.md"
+
+        self._profile.dump_stats(prof_path)
+        stats_text = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=stats_text)
+        stats.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ])
+        allocations = snapshot.statistics("lineno")[:TOP_ALLOCATIONS]
+
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(f"# Profile: {self.name}\n\n")
+            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            f.write(f"- **Wall time**: {wall:.3f}s\n")
+            f.write(f"- **CPU time**: {cpu:.3f}s\n")
+            f.write(f"- **Peak RSS**: {_format_bytes(_peak_rss_bytes())}\n")
+            f.write(f"- **Peak traced memory**: {_format_bytes(traced_peak)}\n")
+            f.write(f"- **CPU profile**: `{prof_path.name}` (load with `pstats`)\n\n")
+
+            if self.phases:
+                f.write("## Wall-Clock Phases\n\n")
+                f.write("Concurrent phases overlap, so totals can exceed wall time.\n\n")
+                f.write("| Phase | Total (s) | Count | Mean (s) | Max (s) |\n")
+                f.write("|-------|-----------|-------|----------|---------|\n")
+                for phase, (total, count, longest) in sorted(
+                    self.phases.items(), key=lambda item: item[1][0], reverse=True
+                ):
+                    f.write(f"| {phase} | {total:.3f} | {count} | "
+                            f"{total / count:.3f} | {longest:.3f} |\n")
+                f.write("\n")
+
+            f.write(f"## CPU Profile (top {TOP_FUNCTIONS} by cumulative time)\n\n")
+            f.write("```\n")
+            f.write(stats_text.getvalue().strip())
+            f.write("\n```\n\n")
+
+            f.write(f"## Top Allocations (top {TOP_ALLOCATIONS} by line)\n\n")
+            f.write("| Size | Count | Location |\n")
+            f.write("|------|-------|----------|\n")
+            for stat in allocations:
+                frame = stat.traceback[0]
+                f.write(f"| {_format_bytes(stat.size)} | {stat.count} | "
+                        f"`{frame.filename}:{frame.lineno}` |\n")
+
+        return report_path
@@ -6,6 +6,8 @@ Usage:
     python search.py "javascript style guide"
     python search.py "python best practices" --category python
     python search.py "security" --top 5
+    python search.py "security" --profile
+    python search.py "security" --no-cache
 """
 
 import os
@@ -13,16 +15,26 @@ import re
 import json
 import argparse
 from pathlib import Path
+from collections.abc import Mapping
 from typing import Optional
 
+from compact_index import COMPACT_INDEX_PATH, load_compact_index
+from pack import open_pack, read_document
+from profiling import add_profile_argument, maybe_profile
+from search_cache import SearchCache, cache_key, normalize_query
+
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent
 CONTENT_DIR = PROJECT_ROOT / "content"
 INDEX_PATH = CONTENT_DIR / "index.json"
 
 
-def load_index() -> dict:
-    """Load the content index."""
+def load_index() -> Mapping:
+    """Load the content index, preferring the compact binary form."""
+    compact = load_compact_index()
+    if compact is not None:
+        return compact
+    
     if not INDEX_PATH.exists():
         print("Error: Index not found. Run 'python crawl.py' first.")
         return {}
@@ -32,6 +44,30 @@ def load_index() -> dict:
 
 
 def search_content(
+    query: str,
+    category: Optional[str] = None,
+    top: int = 10,
+    use_cache: bool = True
+) -> list[dict]:
+    """Search the knowledge base, reusing cached results for an unchanged index."""
+    # Scan the same form the cache is keyed on, so a hit matches a fresh scan
+    query = normalize_query(query)
+    if not use_cache or not (INDEX_PATH.exists() or COMPACT_INDEX_PATH.exists()):
+        return scan_content(query, category, top)
+    
+    cache = SearchCache()
+    key = cache_key(query, category, top)
+    results = cache.get(key)
+    if results is None:
+        results = scan_content(query, category, top)
+        try:
+            cache.put(key, results)
+        except OSError as e:
+            print(f"Warning: Could not cache search results: {e}")
+    return results
+
+
+def scan_content(
     query: str,
     category: Optional[str] = None,
     top: int = 10
@@ -42,6 +78,7 @@ def search_content(
     if not index:
         return []
     
+    pack = open_pack()
     results = []
     query_lower = query.lower()
     query_words = query_lower.split()
@@ -67,12 +104,12 @@ def search_content(
         if query_lower in item.get("subcategory", "").lower():
             score += 3
         
-        # Read file content for deeper search
-        file_path = PROJECT_ROOT / item["file"]
-        if file_path.exists() and score == 0:
+        # Read file content for deeper search (loose file or content pack)
+        if score == 0:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read().lower()
+                content = read_document(item["file"], pack)
+                if content:
+                    content = content.lower()
                     for word in query_words:
                         if word in content:
                             score += 1
@@ -86,6 +123,9 @@ def search_content(
                 "score": score
             })
     
+    if pack:
+        pack.close()
+
     # Sort by score
     results.sort(key=lambda x: x["score"], reverse=True)
     
@@ -133,21 +173,29 @@ def main():
         action="store_true",
         help="Output as JSON"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and don't update the shared result cache"
+    )
+    add_profile_argument(parser)
     
     args = parser.parse_args()
     
-    results = search_content(
-        args.query,
-        category=args.category,
-        top=args.top
-    )
-    
-    if args.json:
-        print(json.dumps(results, indent=2))
-    else:
-        print(f"\n🔍 Search Results for: '{args.query}'")
-        print("=" * 50)
-        print(format_results(results))
+    with maybe_profile("search", CONTENT_DIR, args.profile):
+        results = search_content(
+            args.query,
+            category=args.category,
+            top=args.top,
+            use_cache=not args.no_cache
+        )
+        
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print(f"\n🔍 Search Results for: '{args.query}'")
+            print("=" * 50)
+            print(format_results(results))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+On-disk LRU cache of search results shared between `search.py` runs.
+
+Each entry is one small JSON file named by a hash of the normalized query,
+category and `top`. Entries also record the index version (size and mtime of
+the index files and content pack), so a cached result is ignored as soon as
+the crawler writes a new index; the crawler also clears the cache outright.
+Hits refresh the entry's mtime, and the least recently used entries are
+evicted once the cache grows past its bound.
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent.parent
+CONTENT_DIR = PROJECT_ROOT / "content"
+CACHE_DIR = CONTENT_DIR / ".search_cache"
+
+MAX_ENTRIES = 256
+
+# Files whose change means search results may change
+VERSION_FILES = [
+    CONTENT_DIR / "index.json",
+    CONTENT_DIR / "index.bin",
+    CONTENT_DIR / "packs" / "manifest.json"
+]
+
+
+def index_version() -> str:
+    """Fingerprint of the index files; changes whenever the crawler rewrites them."""
+    parts = []
+    for path in VERSION_FILES:
+        try:
+            stat = path.stat()
+            parts.append(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{path.name}:-")
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:16]
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace; searches must run on this form too."""
+    return " ".join(query.lower().split())
+
+
+def cache_key(query: str, category: Optional[str], top: int) -> str:
+    """Key on the normalized query so trivially different spellings share an entry."""
+    return json.dumps([normalize_query(query), (category or "").lower(), top])
+
+
+class SearchCache:
+    """Bounded, version-checked result cache with one file per entry."""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, max_entries: int = MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.version = index_version()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / (hashlib.sha256(key.encode()).hexdigest()[:24] + ".json")
+
+    def get(self, key: str) -> Optional[list[dict]]:
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("version") != self.version or entry.get("key") != key:
+            return None
+
+        # Mark as recently used for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry["results"]
+
+    def put(self, key: str, results: list[dict]):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"key": key, "version": self.version, "results": results}, f)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                pass  # removed by another process
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort()
+        for _, path in entries[:len(entries) - self.max_entries]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def clear_search_cache(cache_dir: Path = CACHE_DIR) -> int:
+    """Delete every cached result; returns how many entries were removed."""
+    if not cache_dir.exists():
+        return 0
+    removed = 0
+    for path in cache_dir.glob("*.json"):
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed